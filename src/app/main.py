@@ -1,13 +1,13 @@
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 from app.chore import lifespan
 from app.services.crud_item_store import router as item_store_router
 from app.services.orders import orders_api_router, webhooks_api_router
 from app.shared.exceptions import AppException, InternalError
-from app.shared.responses import ErrorResponse, ValidationErrorResponse
+from app.shared.responses import ValidationErrorResponse, error_from_exception
 from app.shared.logger import get_logger
 
 logger = get_logger(__name__)
@@ -18,17 +18,18 @@ app = FastAPI(title="OpenTaberna API", lifespan=lifespan)
 
 # Global exception handler for AppException
 @app.exception_handler(AppException)
-async def app_exception_handler(request: Request, exc: AppException) -> JSONResponse:
+async def app_exception_handler(request: Request, exc: AppException) -> Response:
     """
     Handle all AppException instances and convert them to HTTP responses.
 
-    The ErrorResponse.from_exception method automatically maps error categories
-    to appropriate HTTP status codes (404, 422, 401, 403, 400, 500, 502).
+    error_from_exception automatically maps error categories to appropriate
+    HTTP status codes (404, 422, 401, 403, 400, 500, 502).
     """
-    error_response = ErrorResponse.from_exception(exc)
-    return JSONResponse(
+    error_response = error_from_exception(exc)
+    return Response(
+        content=error_response.to_json(),
         status_code=error_response.status_code,
-        content=error_response.model_dump(mode="json"),
+        media_type="application/json",
     )
 
 
@@ -36,7 +37,7 @@ async def app_exception_handler(request: Request, exc: AppException) -> JSONResp
 @app.exception_handler(RequestValidationError)
 async def request_validation_exception_handler(
     request: Request, exc: RequestValidationError
-) -> JSONResponse:
+) -> Response:
     """
     Handle FastAPI RequestValidationError and convert to our standard ValidationErrorResponse.
 
@@ -56,15 +57,16 @@ async def request_validation_exception_handler(
         message="Validation failed",
         validation_errors=validation_errors,
     )
-    return JSONResponse(
+    return Response(
+        content=error_response.to_json(),
         status_code=422,
-        content=error_response.model_dump(mode="json"),
+        media_type="application/json",
     )
 
 
 # Catch-all exception handler for unexpected errors
 @app.exception_handler(Exception)
-async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def generic_exception_handler(request: Request, exc: Exception) -> Response:
     """
     Handle all unexpected exceptions and convert them to structured error responses.
 
@@ -90,10 +92,11 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
         },
         original_exception=exc,
     )
-    error_response = ErrorResponse.from_exception(error)
-    return JSONResponse(
+    error_response = error_from_exception(error)
+    return Response(
+        content=error_response.to_json(),
         status_code=500,
-        content=error_response.model_dump(mode="json"),
+        media_type="application/json",
     )
 
 
@@ -24,24 +24,49 @@ Architecture:
     - factory: Logger creation and caching
 """
 
+from importlib import import_module
+
 # Main API
 from .factory import get_logger, clear_loggers
 from .logger import AppLogger
 from .context import LogContext, setup_request_logging
-from .config import LoggerConfig
 
-# Enums
-from app.shared.config.enums import Environment
+# Everything else is imported on first access (PEP 562), so importing the
+# package for get_logger doesn't load every formatter/filter/handler module
+_LAZY_ATTRS = {
+    "LoggerConfig": ".config",
+    # Enums
+    "Environment": "app.shared.config.enums",
+    "LogLevel": ".enums",
+    # Interfaces (for custom implementations)
+    "ILogFormatter": ".interfaces",
+    "ILogFilter": ".interfaces",
+    "ILogHandler": ".interfaces",
+    # Implementations
+    "JSONFormatter": ".formatters",
+    "ConsoleFormatter": ".formatters",
+    "SensitiveDataFilter": ".filters",
+    "LevelFilter": ".filters",
+    "ConsoleHandler": ".handlers",
+    "FileHandler": ".handlers",
+    "DailyRotatingFileHandler": ".handlers",
+}
+
+
+def __getattr__(name: str):
+    """Resolve lazily exported names on first access."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-from .enums import LogLevel
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
-# Interfaces (for custom implementations)
-from .interfaces import ILogFormatter, ILogFilter, ILogHandler
 
-# Implementations
-from .formatters import JSONFormatter, ConsoleFormatter
-from .filters import SensitiveDataFilter, LevelFilter
-from .handlers import ConsoleHandler, FileHandler, DailyRotatingFileHandler
+def __dir__():
+    """Include lazily exported names in dir()."""
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
 
 __all__ = [
@@ -25,13 +25,25 @@ class LoggerConfig:
         handlers: Optional[List[ILogHandler]] = None,
         filters: Optional[List[ILogFilter]] = None,
         environment: Environment = Environment.DEVELOPMENT,
+        sensitive_filter: Optional[SensitiveDataFilter] = None,
     ):
         self.name = name
         self.level = level
         self.handlers = handlers or []
-        self.filters = filters or [SensitiveDataFilter()]
         self.environment = environment
 
+        if filters:
+            self.filters = filters
+            # Reuse a configured sensitive-data filter for kwarg sanitizing
+            if sensitive_filter is None:
+                sensitive_filter = next(
+                    (f for f in filters if isinstance(f, SensitiveDataFilter)), None
+                )
+        else:
+            sensitive_filter = sensitive_filter or SensitiveDataFilter()
+            self.filters = [sensitive_filter]
+        self.sensitive_filter = sensitive_filter
+
     @classmethod
     def from_environment(
         cls, name: str, env: Environment, log_dir: Optional[Path] = None
@@ -49,22 +61,26 @@ class LoggerConfig:
     @classmethod
     def _development_config(cls, name: str) -> "LoggerConfig":
         """Development environment configuration."""
+        sensitive_filter = SensitiveDataFilter()
         return cls(
             name=name,
             level=LogLevel.DEBUG,
             handlers=[ConsoleHandler(LogLevel.DEBUG)],
-            filters=[SensitiveDataFilter()],
+            filters=[sensitive_filter],
+            sensitive_filter=sensitive_filter,
             environment=Environment.DEVELOPMENT,
         )
 
     @classmethod
     def _testing_config(cls, name: str) -> "LoggerConfig":
         """Testing environment configuration."""
+        sensitive_filter = SensitiveDataFilter()
         return cls(
             name=name,
             level=LogLevel.WARNING,
             handlers=[ConsoleHandler(LogLevel.WARNING)],
-            filters=[SensitiveDataFilter()],
+            filters=[sensitive_filter],
+            sensitive_filter=sensitive_filter,
             environment=Environment.TESTING,
         )
 
@@ -72,6 +88,7 @@ class LoggerConfig:
     def _staging_config(cls, name: str, log_dir: Optional[Path]) -> "LoggerConfig":
         """Staging environment configuration."""
         log_dir = log_dir or Path("/var/log/opentaberna")
+        sensitive_filter = SensitiveDataFilter()
 
         return cls(
             name=name,
@@ -91,7 +108,8 @@ class LoggerConfig:
                     backup_count=5,
                 ),
             ],
-            filters=[SensitiveDataFilter()],
+            filters=[sensitive_filter],
+            sensitive_filter=sensitive_filter,
             environment=Environment.STAGING,
         )
 
@@ -99,6 +117,7 @@ class LoggerConfig:
     def _production_config(cls, name: str, log_dir: Optional[Path]) -> "LoggerConfig":
         """Production environment configuration."""
         log_dir = log_dir or Path("/var/log/opentaberna")
+        sensitive_filter = SensitiveDataFilter()
 
         return cls(
             name=name,
@@ -114,6 +133,7 @@ class LoggerConfig:
                     backup_count=90,
                 ),
             ],
-            filters=[SensitiveDataFilter()],
+            filters=[sensitive_filter],
+            sensitive_filter=sensitive_filter,
             environment=Environment.PRODUCTION,
         )
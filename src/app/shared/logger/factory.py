@@ -5,8 +5,9 @@ Provides convenient access to logger creation and management.
 """
 
 import os
+import sys
+import threading
 from pathlib import Path
-from typing import Dict, Optional
 
 from app.shared.config.enums import Environment
 
@@ -15,14 +16,20 @@ from .logger import AppLogger
 
 
 # Global cache for logger instances
-_loggers: Dict[str, AppLogger] = {}
+_loggers: dict[str, AppLogger] = {}
+
+# ENVIRONMENT values accepted by get_logger's auto-detection
+_ENV_BY_STR: dict[str, Environment] = {env.value: env for env in Environment}
+
+# Guards logger construction; cache hits are read without taking it
+_loggers_lock = threading.Lock()
 
 
 def get_logger(
     name: str,
-    config: Optional[LoggerConfig] = None,
-    environment: Optional[Environment] = None,
-    log_dir: Optional[Path] = None,
+    config: LoggerConfig | None = None,
+    environment: Environment | None = None,
+    log_dir: Path | None = None,
 ) -> AppLogger:
     """
     Get or create a logger instance.
@@ -40,28 +47,45 @@ def get_logger(
         logger = get_logger(__name__)
         logger.info("Application started")
     """
-    if name in _loggers:
-        return _loggers[name]
+    cached = _loggers.get(name)
+    if cached is not None:
+        return cached
+
+    with _loggers_lock:
+        # Re-check: another thread may have built it while we waited
+        cached = _loggers.get(name)
+        if cached is not None:
+            return cached
+
+        # Intern once at registration so the cache key and the config/record
+        # name share one string and later lookups hit the identity fast path
+        name = sys.intern(name)
+        logger = _build_logger(name, config, environment, log_dir)
+        _loggers[name] = logger
+        return logger
 
+
+def _build_logger(
+    name: str,
+    config: LoggerConfig | None,
+    environment: Environment | None,
+    log_dir: Path | None,
+) -> AppLogger:
+    """Construct a new AppLogger, resolving the config if not given."""
     if config is None:
         # Auto-detect environment from environment variable
         env_str = os.getenv("ENVIRONMENT", "development").lower()
-        try:
-            env = Environment(env_str)
-        except ValueError:
-            env = Environment.DEVELOPMENT
+        env = _ENV_BY_STR.get(env_str, Environment.DEVELOPMENT)
 
         if environment:
             env = environment
 
         config = LoggerConfig.from_environment(name, env, log_dir)
 
-    logger = AppLogger(config)
-    _loggers[name] = logger
-    return logger
+    return AppLogger(config)
 
 
 def clear_loggers():
     """Clear all cached logger instances. Useful for testing."""
-    global _loggers
-    _loggers.clear()
+    with _loggers_lock:
+        _loggers.clear()
@@ -6,7 +6,6 @@ All handlers are interchangeable through the ILogHandler interface.
 
 import logging
 import sys
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
 from pathlib import Path
 
 from .interfaces import ILogFormatter, ILogHandler
@@ -55,6 +54,9 @@ class FileHandler(ILogHandler):
 
     def setup(self, logger: logging.Logger, formatter: ILogFormatter) -> None:
         """Setup rotating file handler."""
+        # Deferred: logging.handlers is only needed for file output
+        from logging.handlers import RotatingFileHandler
+
         self.filepath.parent.mkdir(parents=True, exist_ok=True)
 
         handler = RotatingFileHandler(
@@ -80,6 +82,9 @@ class DailyRotatingFileHandler(ILogHandler):
 
     def setup(self, logger: logging.Logger, formatter: ILogFormatter) -> None:
         """Setup daily rotating file handler."""
+        # Deferred: logging.handlers is only needed for file output
+        from logging.handlers import TimedRotatingFileHandler
+
         self.filepath.parent.mkdir(parents=True, exist_ok=True)
 
         handler = TimedRotatingFileHandler(
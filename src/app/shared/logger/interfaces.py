@@ -5,7 +5,7 @@ Following Interface Segregation Principle - focused, minimal interfaces.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any
 import logging
 
 
@@ -27,7 +27,7 @@ class ILogFilter(ABC):
         pass
 
     @abstractmethod
-    def sanitize(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def sanitize(self, data: dict[str, Any]) -> dict[str, Any]:
         """Remove sensitive information from log data."""
         pass
 
@@ -8,6 +8,7 @@ not concrete implementations.
 import logging
 import time
 from contextlib import contextmanager
+from typing import Callable
 
 from app.shared.config.enums import Environment
 
@@ -15,7 +16,81 @@ from .config import LoggerConfig
 from .enums import LogLevel
 from .filters import SensitiveDataFilter
 from .formatters import ConsoleFormatter, JSONFormatter
-from .interfaces import ILogFilter
+
+# Reserved LogRecord attributes that cannot be overridden via extra
+_RESERVED_LOGRECORD_ATTRS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "created",
+        "filename",
+        "funcName",
+        "levelname",
+        "levelno",
+        "lineno",
+        "module",
+        "msecs",
+        "message",
+        "pathname",
+        "process",
+        "processName",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "taskName",
+    }
+)
+
+# Numeric stdlib level for each LogLevel
+_LEVEL_NO = {
+    LogLevel.DEBUG: logging.DEBUG,
+    LogLevel.INFO: logging.INFO,
+    LogLevel.WARNING: logging.WARNING,
+    LogLevel.ERROR: logging.ERROR,
+    LogLevel.CRITICAL: logging.CRITICAL,
+}
+
+
+def _strip_reserved(extra: dict) -> dict:
+    """Drop keys that would clash with LogRecord attributes."""
+    if extra.keys().isdisjoint(_RESERVED_LOGRECORD_ATTRS):
+        return extra
+    return {k: v for k, v in extra.items() if k not in _RESERVED_LOGRECORD_ATTRS}
+
+
+def _make_emitter(
+    log: Callable[..., None],
+    level_no: int,
+    sanitize: Callable[[dict], dict],
+    enabled: bool,
+    default_exc_info: bool,
+) -> Callable[..., None]:
+    """
+    Build a logging function specialized for one level.
+
+    The stdlib logger's ``_log``, level number, sanitizer and enabled flag
+    are baked into the closure, so a call does no level lookup or dispatch
+    at all.
+    """
+    if not enabled:
+
+        def emit_disabled(message: str, exc_info: bool = default_exc_info, **kwargs):
+            return None
+
+        return emit_disabled
+
+    def emit(message: str, exc_info: bool = default_exc_info, **kwargs):
+        # Nothing to sanitize or filter without extra fields
+        if not kwargs:
+            log(level_no, message, (), exc_info)
+            return
+        log(level_no, message, (), exc_info, _strip_reserved(sanitize(kwargs)))
+
+    return emit
 
 
 class AppLogger:
@@ -24,15 +99,45 @@ class AppLogger:
 
     This class orchestrates formatters, handlers, and filters without
     tight coupling to specific implementations.
+
+    The level methods are per-instance functions specialized for their
+    level, rebuilt by ``invalidate_level_cache()``:
+
+    - ``debug(message, **kwargs)``: Log debug message
+    - ``info(message, **kwargs)``: Log info message
+    - ``warning(message, **kwargs)``: Log warning message
+    - ``error(message, exc_info=False, **kwargs)``: Log error message
+    - ``critical(message, exc_info=True, **kwargs)``: Log critical message
+    - ``exception(message, **kwargs)``: Log exception with traceback
     """
 
+    __slots__ = (
+        "config",
+        "_logger",
+        "_sensitive_filter",
+        "_sanitize",
+        "_enabled",
+        "debug",
+        "info",
+        "warning",
+        "error",
+        "critical",
+        "exception",
+    )
+
+    debug: Callable[..., None]
+    info: Callable[..., None]
+    warning: Callable[..., None]
+    error: Callable[..., None]
+    critical: Callable[..., None]
+    exception: Callable[..., None]
+
     def __init__(self, config: LoggerConfig):
         self.config = config
         self._logger = self._setup_logger()
-        self._sensitive_filter = next(
-            (f for f in config.filters if isinstance(f, SensitiveDataFilter)),
-            SensitiveDataFilter(),
-        )
+        self._sensitive_filter = config.sensitive_filter or SensitiveDataFilter()
+        self._sanitize = self._sensitive_filter.sanitize
+        self.invalidate_level_cache()
 
     def _setup_logger(self) -> logging.Logger:
         """Initialize and configure the logger."""
@@ -53,78 +158,69 @@ class AppLogger:
         for handler in self.config.handlers:
             handler.setup(logger, formatter)
 
-        # Add filters
+        # Add filters - logging.Filterer calls .filter(record) on any object
+        # that has it, so ILogFilter instances are attached directly
         for log_filter in self.config.filters:
             if hasattr(log_filter, "filter"):
-                logger.addFilter(_FilterWrapper(log_filter))
+                logger.addFilter(log_filter)
 
         return logger
 
-    def debug(self, message: str, **kwargs):
-        """Log debug message."""
-        self._log(LogLevel.DEBUG, message, **kwargs)
-
-    def info(self, message: str, **kwargs):
-        """Log info message."""
-        self._log(LogLevel.INFO, message, **kwargs)
-
-    def warning(self, message: str, **kwargs):
-        """Log warning message."""
-        self._log(LogLevel.WARNING, message, **kwargs)
-
-    def error(self, message: str, exc_info: bool = False, **kwargs):
-        """Log error message."""
-        self._log(LogLevel.ERROR, message, exc_info=exc_info, **kwargs)
-
-    def critical(self, message: str, exc_info: bool = True, **kwargs):
-        """Log critical message."""
-        self._log(LogLevel.CRITICAL, message, exc_info=exc_info, **kwargs)
-
-    def exception(self, message: str, **kwargs):
-        """Log exception with traceback."""
-        self._log(LogLevel.ERROR, message, exc_info=True, **kwargs)
-
-    def _log(self, level: LogLevel, message: str, exc_info: bool = False, **kwargs):
-        """Internal logging method."""
-        # Reserved LogRecord attributes that cannot be overridden
-        reserved_attrs = {
-            "name",
-            "msg",
-            "args",
-            "created",
-            "filename",
-            "funcName",
-            "levelname",
-            "levelno",
-            "lineno",
-            "module",
-            "msecs",
-            "message",
-            "pathname",
-            "process",
-            "processName",
-            "relativeCreated",
-            "thread",
-            "threadName",
-            "exc_info",
-            "exc_text",
-            "stack_info",
-            "taskName",
-        }
-
-        # Sanitize kwargs
-        sanitized_kwargs = self._sensitive_filter.sanitize(kwargs)
+    def invalidate_level_cache(self) -> None:
+        """
+        Refresh the cached level decisions from the underlying logger.
 
-        # Remove any reserved attributes from kwargs to avoid conflicts
-        safe_kwargs = {
-            k: v for k, v in sanitized_kwargs.items() if k not in reserved_attrs
+        Call this after changing the level of the wrapped ``logging.Logger``
+        (or after ``logging.disable``). Records are handed to the stdlib
+        logger's ``_log`` without a second ``isEnabledFor`` check, so the
+        cached decisions are the only level gate.
+        """
+        is_enabled_for = self._logger.isEnabledFor
+        self._enabled = {
+            level: is_enabled_for(level_no) for level, level_no in _LEVEL_NO.items()
         }
-
-        # Get log method
-        log_method = getattr(self._logger, level.value.lower())
-
-        # Log with extra fields
-        log_method(message, exc_info=exc_info, extra=safe_kwargs)
+        self._build_emitters()
+
+    def _build_emitters(self) -> None:
+        """(Re)build the per-level logging functions."""
+        # Logger._log is private API, but its (level, msg, args, exc_info,
+        # extra, ...) signature has been stable across Python 3. Calling it
+        # directly skips Logger.debug/info/...'s repeat of our level check.
+        log = self._logger._log
+        enabled = self._enabled
+        sanitize = self._sanitize
+        # Store through AppLogger's slot descriptors so a subclass that
+        # overrides a level method (and calls super()) keeps its override
+        slots = AppLogger.__dict__
+
+        slots["debug"].__set__(
+            self,
+            _make_emitter(log, logging.DEBUG, sanitize, enabled[LogLevel.DEBUG], False),
+        )
+        slots["info"].__set__(
+            self,
+            _make_emitter(log, logging.INFO, sanitize, enabled[LogLevel.INFO], False),
+        )
+        slots["warning"].__set__(
+            self,
+            _make_emitter(
+                log, logging.WARNING, sanitize, enabled[LogLevel.WARNING], False
+            ),
+        )
+        slots["error"].__set__(
+            self,
+            _make_emitter(log, logging.ERROR, sanitize, enabled[LogLevel.ERROR], False),
+        )
+        slots["critical"].__set__(
+            self,
+            _make_emitter(
+                log, logging.CRITICAL, sanitize, enabled[LogLevel.CRITICAL], True
+            ),
+        )
+        slots["exception"].__set__(
+            self,
+            _make_emitter(log, logging.ERROR, sanitize, enabled[LogLevel.ERROR], True),
+        )
 
     @contextmanager
     def measure_time(self, operation: str, **context):
@@ -136,31 +232,27 @@ class AppLogger:
                 # ... operation
                 pass
         """
+        # Only build messages for levels that will actually be emitted
+        enabled = self._enabled
         start_time = time.perf_counter()
-        self.debug(f"Starting {operation}", **context)
+        if enabled[LogLevel.DEBUG]:
+            self.debug(f"Starting {operation}", **context)
 
         try:
             yield
         except Exception:
-            duration = time.perf_counter() - start_time
-            self.error(
-                f"Failed {operation}",
-                duration_ms=duration * 1000,
-                exc_info=True,
-                **context,
-            )
+            if enabled[LogLevel.ERROR]:
+                duration = time.perf_counter() - start_time
+                self.error(
+                    f"Failed {operation}",
+                    duration_ms=duration * 1000,
+                    exc_info=True,
+                    **context,
+                )
             raise
         else:
-            duration = time.perf_counter() - start_time
-            self.info(f"Completed {operation}", duration_ms=duration * 1000, **context)
-
-
-class _FilterWrapper(logging.Filter):
-    """Wrapper to use custom ILogFilter with logging.Logger."""
-
-    def __init__(self, custom_filter: ILogFilter):
-        super().__init__()
-        self.custom_filter = custom_filter
-
-    def filter(self, record: logging.LogRecord) -> bool:
-        return self.custom_filter.filter(record)
+            if enabled[LogLevel.INFO]:
+                duration = time.perf_counter() - start_time
+                self.info(
+                    f"Completed {operation}", duration_ms=duration * 1000, **context
+                )
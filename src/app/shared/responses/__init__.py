@@ -58,7 +58,9 @@ from .factory import (
     error_from_exception,
     validation_error,
     paginated,
+    paginated_validated,
     cursor_paginated,
+    set_shared_metadata,
     # Aliases
     ok,
     created,
@@ -93,7 +95,9 @@ __all__ = [
     "error_from_exception",
     "validation_error",
     "paginated",
+    "paginated_validated",
     "cursor_paginated",
+    "set_shared_metadata",
     # Aliases
     "ok",
     "created",
@@ -5,10 +5,43 @@ Provides common fields and structure for all API responses.
 Following SOLID principles with shared behavior in base class.
 """
 
+import os
+import time
 from datetime import datetime, UTC
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Literal, Optional
 from pydantic import BaseModel, Field, ConfigDict
 
+# Opt-in: share one timestamp per millisecond between responses instead of
+# reading the clock for each one. Worth it only at very high response rates.
+_COARSE_TIMESTAMP = os.getenv("FASTAPI_COARSE_TIMESTAMP") == "1"
+
+# (monotonic_ns, datetime) of the last coarse timestamp, swapped as one tuple
+# so concurrent readers never pair a new time with an old datetime. The age
+# is measured on the monotonic clock, so wall-clock steps (e.g. NTP
+# corrections) can't pin an old datetime.
+_last_timestamp: tuple[int, Optional[datetime]] = (0, None)
+
+
+# Parametrized generic responses by (class, type arguments)
+_parametrized: Dict[tuple[type, Any], type] = {}
+
+
+def _utcnow() -> datetime:
+    """Current UTC time."""
+    return datetime.now(UTC)
+
+
+def _coarse_utcnow() -> datetime:
+    """Current UTC time, reused for up to 1ms between calls."""
+    global _last_timestamp
+    mono_ns = time.monotonic_ns()
+    last_mono_ns, last_dt = _last_timestamp
+    if last_dt is not None and mono_ns - last_mono_ns < 1_000_000:
+        return last_dt
+    now = datetime.fromtimestamp(time.time_ns() / 1e9, tz=UTC)
+    _last_timestamp = (mono_ns, now)
+    return now
+
 
 class BaseResponse(BaseModel):
     """
@@ -31,7 +64,7 @@ class BaseResponse(BaseModel):
     )
 
     timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(UTC),
+        default_factory=_coarse_utcnow if _COARSE_TIMESTAMP else _utcnow,
         description="Timestamp when the response was generated (UTC)",
     )
 
@@ -54,3 +87,56 @@ class BaseResponse(BaseModel):
             }
         }
     )
+
+    def __class_getitem__(cls, params: Any) -> Any:
+        """
+        Return the parametrized class, e.g. ``SuccessResponse[User]``.
+
+        Pydantic builds each parametrization once and caches it, but its
+        lookup still costs a few microseconds. The factory helpers subscribe
+        on every call, so keep the result in a plain dict in front of it.
+        """
+        key = (cls, params)
+        try:
+            return _parametrized[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable type arguments - let pydantic handle them
+            return super().__class_getitem__(params)
+        result = super().__class_getitem__(params)
+        if isinstance(result, type):
+            # Recursive generics get a PydanticRecursiveRef placeholder
+            # while pydantic is still building them - never cache that
+            _parametrized[key] = result
+        return result
+
+    def to_dict(self, mode: Literal["python", "json"] = "python") -> Dict[str, Any]:
+        """
+        Serialize the response to a dict.
+
+        Same output as ``model_dump(mode=mode)``, but calls the class's
+        compiled pydantic-core serializer directly instead of going through
+        ``model_dump``'s option handling.
+
+        Args:
+            mode: "python" keeps Python objects (datetime, ...), "json"
+                converts them to JSON-compatible types
+
+        Returns:
+            Dict with all response fields, nested models serialized
+        """
+        return self.__pydantic_serializer__.to_python(self, mode=mode)
+
+    def to_json(self) -> bytes:
+        """
+        Serialize the response straight to JSON bytes.
+
+        Same output as ``model_dump_json()``, encoded. pydantic-core writes
+        the JSON directly, without building an intermediate dict for
+        ``json.dumps``.
+
+        Returns:
+            UTF-8 encoded JSON document
+        """
+        return self.__pydantic_serializer__.to_json(self)
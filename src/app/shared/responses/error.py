@@ -5,20 +5,39 @@ Response models for error cases, integrated with AppException system.
 Maps exceptions to HTTP status codes and standardized error formats.
 """
 
-from typing import TYPE_CHECKING, Optional, Dict, Any
+from functools import cache
+from typing import TYPE_CHECKING, Literal, Optional, Dict, Any
 from pydantic import Field, ConfigDict
 from .base import BaseResponse
 
 if TYPE_CHECKING:
     from app.shared.exceptions import AppException
 
-# Optional logger import - gracefully handle if not available
-try:
-    from app.shared.logger import get_logger
-
-    _logger = get_logger(__name__)
-except ImportError:
-    _logger = None
+# HTTP status code for each ErrorCategory. Keyed by value so the exceptions
+# module isn't imported at runtime; ErrorCategory is a str Enum, so its
+# members look up directly.
+_CATEGORY_STATUS_CODES: Dict[str, int] = {
+    "not_found": 404,
+    "validation": 422,
+    "authentication": 401,
+    "authorization": 403,
+    "business_rule": 400,
+    "database": 500,
+    "external_service": 502,
+    "internal": 500,
+}
+
+
+# Optional logger - resolved on first use so importing this module
+# doesn't build loggers
+@cache
+def _get_logger():
+    """Resolve the optional logger on first use, None if unavailable."""
+    try:
+        from app.shared.logger import get_logger
+    except ImportError:
+        return None
+    return get_logger(__name__)
 
 
 class ErrorResponse(BaseResponse):
@@ -40,6 +59,8 @@ class ErrorResponse(BaseResponse):
 
     success: bool = Field(default=False, description="Always False for error responses")
 
+    # ge/le are checked inside pydantic-core's int validator (no Python
+    # call) and show up as minimum/maximum in the OpenAPI schema
     status_code: int = Field(
         ...,
         description="HTTP status code (4xx for client errors, 5xx for server errors)",
@@ -85,22 +106,12 @@ class ErrorResponse(BaseResponse):
             ...     response = ErrorResponse.from_exception(e)
         """
         # Map error category to HTTP status code
-        status_code_map = {
-            "not_found": 404,
-            "validation": 422,
-            "authentication": 401,
-            "authorization": 403,
-            "business_rule": 400,
-            "database": 500,
-            "external_service": 502,
-            "internal": 500,
-        }
-
-        status_code = status_code_map.get(exception.category.value, 500)
+        status_code = _CATEGORY_STATUS_CODES.get(exception.category, 500)
 
         # Optional debug logging for response creation
-        if _logger:
-            _logger.debug(
+        logger = _get_logger()
+        if logger:
+            logger.debug(
                 f"Creating ErrorResponse from {exception.__class__.__name__}",
                 extra={
                     "error_code": exception.error_code.value,
@@ -109,7 +120,6 @@ class ErrorResponse(BaseResponse):
                 },
             )
 
-        # Access exception attributes directly
         return cls(
             success=False,
             message=exception.message,
@@ -174,6 +184,34 @@ class ValidationErrorResponse(ErrorResponse):
         None, description="List of field-level validation errors"
     )
 
+    def to_dict_soa(self, mode: Literal["python", "json"] = "python") -> Dict[str, Any]:
+        """
+        Serialize with validation errors grouped by key instead of per error.
+
+        ``validation_errors`` becomes one list per key, e.g.
+        ``{"field": ["email", "age"], "message": ["Invalid", "Too low"]}``.
+        That saves a dict per error for responses with many of them. An
+        error missing a key gets None in that key's list. The model field
+        itself stays a list of dicts, so ``to_dict()`` is unchanged.
+
+        Args:
+            mode: "python" keeps Python objects (datetime, ...), "json"
+                converts them to JSON-compatible types
+
+        Returns:
+            Dict like ``to_dict(mode=mode)`` with ``validation_errors`` grouped
+        """
+        data = self.__pydantic_serializer__.to_python(self, mode=mode)
+        errors = data["validation_errors"]
+        if errors is None:
+            return data
+
+        keys = dict.fromkeys(key for error in errors for key in error)
+        data["validation_errors"] = {
+            key: [error.get(key) for error in errors] for key in keys
+        }
+        return data
+
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
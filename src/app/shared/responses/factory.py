@@ -5,9 +5,11 @@ Convenience functions for creating standardized API responses quickly.
 Reduces boilerplate and ensures consistent response structure.
 """
 
-from typing import TYPE_CHECKING, TypeVar, Optional, Dict, Any, List
-from math import ceil
+import sys
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING, TypeVar, Optional, Dict, Any, Iterable, List, Type
 
+from .base import BaseResponse
 from .success import SuccessResponse, DataResponse, MessageResponse
 from .error import ErrorResponse, ValidationErrorResponse
 from .pagination import PaginatedResponse, PageInfo, CursorPaginatedResponse, CursorInfo
@@ -15,25 +17,132 @@ from .pagination import PaginatedResponse, PageInfo, CursorPaginatedResponse, Cu
 if TYPE_CHECKING:
     from app.shared.exceptions import AppException
 
-# Optional config and logger imports - gracefully handle if not available
-try:
-    from app.shared.config import get_settings
 
-    _settings = get_settings()
-except ImportError:
-    _settings = None
+# Optional config and logger - resolved on first use so importing this
+# module doesn't parse settings or build loggers
+@cache
+def _get_settings():
+    """Resolve the optional settings on first use, None if unavailable."""
+    try:
+        from app.shared.config import get_settings
+    except ImportError:
+        return None
+    return get_settings()
 
-try:
-    from app.shared.logger import get_logger
 
-    _logger = get_logger(__name__)
-except ImportError:
-    _logger = None
+@cache
+def _get_logger():
+    """Resolve the optional logger on first use, None if unavailable."""
+    try:
+        from app.shared.logger import get_logger
+    except ImportError:
+        return None
+    return get_logger(__name__)
+
+
+class _ReadOnlyDict(dict):
+    """
+    dict that rejects mutation, for metadata shared between responses.
+
+    A dict subclass rather than a MappingProxyType, because pydantic-core
+    serializes dict subclasses natively but can't serialize a mappingproxy
+    as a Dict field.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("shared response metadata is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        # copy/pickle rebuild dicts item by item; pass the items to __init__
+        return (_ReadOnlyDict, (dict(self),))
+
+
+# Any response type, for helpers that return their argument
+R = TypeVar("R", bound=BaseResponse)
+
+# Read-only metadata attached by the factories when none is passed
+_shared_metadata: Optional[_ReadOnlyDict] = None
+
+
+def set_shared_metadata(metadata: Optional[Dict[str, Any]]) -> None:
+    """
+    Set metadata attached to every factory-built response by default.
+
+    Use this for values that are the same for every response, such as the
+    API version. Call it once at startup. All responses then reference one
+    read-only copy instead of each carrying its own dict. A factory's own
+    ``metadata`` argument still takes precedence.
+
+    Args:
+        metadata: Shared metadata, or None to stop attaching any
+
+    Example:
+        >>> set_shared_metadata({"api_version": "1.0"})
+        >>> success(data=item).metadata["api_version"]
+        '1.0'
+    """
+    global _shared_metadata
+    _shared_metadata = None if metadata is None else _ReadOnlyDict(metadata)
+
+
+def _with_shared_metadata(response: R) -> R:
+    """
+    Attach the shared metadata to a response built without any.
+
+    Written into the instance dict directly, since validating it would give
+    every response its own mutable copy.
+    """
+    if response.metadata is None and _shared_metadata is not None:
+        response.__dict__["metadata"] = _shared_metadata
+    return response
+
+
+@cache
+def _known_codes() -> Dict[str, str]:
+    """
+    Canonical string objects for the known error codes and categories.
+
+    Maps every ErrorCode/ErrorCategory value to one shared, interned str,
+    so error() doesn't store a fresh copy (or an enum member) per response.
+    """
+    from app.shared.exceptions import ErrorCategory, ErrorCode
+
+    return {
+        member.value: sys.intern(member.value)
+        for enum in (ErrorCode, ErrorCategory)
+        for member in enum
+    }
+
 
 # Generic type variable
 T = TypeVar("T")
 
 
+@lru_cache(maxsize=512)
+def _make_page_info(page: int, size: int, total: int, pages: int) -> PageInfo:
+    """
+    Build a PageInfo, reusing instances for repeated values.
+
+    List endpoints mostly see the same few (page, size, total) combinations,
+    so most calls skip validation entirely. PageInfo is frozen, which makes
+    sharing one instance between responses safe. Invalid values still raise
+    on every call, since lru_cache doesn't cache exceptions.
+    """
+    return PageInfo(page=page, size=size, total=total, pages=pages)
+
+
+def _page_info(page: int, size: int, total: int) -> PageInfo:
+    """PageInfo for a page, with the page count derived from total and size."""
+    # Integer ceiling division - exact for any total, no float round-trip
+    pages = -(-total // size) if size > 0 else 0
+    return _make_page_info(page, size, total, pages)
+
+
 def success(
     data: Optional[T] = None,
     message: Optional[str] = None,
@@ -47,7 +156,7 @@ def success(
         data: Optional response data
         message: Optional success message
         request_id: Optional request identifier
-        metadata: Optional additional metadata
+        metadata: Optional additional metadata (default: shared metadata)
 
     Returns:
         SuccessResponse with provided data
@@ -56,13 +165,14 @@ def success(
         >>> success(data={"id": 1}, message="User created")
         >>> success(message="Operation completed")
     """
-    return SuccessResponse[T](
+    response = SuccessResponse[T](
         success=True,
         data=data,
         message=message,
         request_id=request_id,
         metadata=metadata,
     )
+    return _with_shared_metadata(response)
 
 
 def data_response(
@@ -78,7 +188,7 @@ def data_response(
         data: Required response data
         message: Optional success message
         request_id: Optional request identifier
-        metadata: Optional additional metadata
+        metadata: Optional additional metadata (default: shared metadata)
 
     Returns:
         DataResponse with provided data
@@ -86,13 +196,14 @@ def data_response(
     Examples:
         >>> data_response(data=user, message="User found")
     """
-    return DataResponse[T](
+    response = DataResponse[T](
         success=True,
         data=data,
         message=message,
         request_id=request_id,
         metadata=metadata,
     )
+    return _with_shared_metadata(response)
 
 
 def message_response(
@@ -106,7 +217,7 @@ def message_response(
     Args:
         message: Success message
         request_id: Optional request identifier
-        metadata: Optional additional metadata
+        metadata: Optional additional metadata (default: shared metadata)
 
     Returns:
         MessageResponse with provided message
@@ -115,9 +226,13 @@ def message_response(
         >>> message_response("Item deleted successfully")
         >>> message_response("Email sent", request_id="req-123")
     """
-    return MessageResponse(
-        success=True, message=message, request_id=request_id, metadata=metadata
+    response = MessageResponse(
+        success=True,
+        message=message,
+        request_id=request_id,
+        metadata=metadata,
     )
+    return _with_shared_metadata(response)
 
 
 def error(
@@ -139,7 +254,7 @@ def error(
         error_category: Error category
         details: Optional error details
         request_id: Optional request identifier
-        metadata: Optional additional metadata
+        metadata: Optional additional metadata (default: shared metadata)
 
     Returns:
         ErrorResponse with provided error information
@@ -152,16 +267,18 @@ def error(
         ...     error_category="NOT_FOUND"
         ... )
     """
-    return ErrorResponse(
+    known_codes = _known_codes()
+    response = ErrorResponse(
         success=False,
         message=message,
         status_code=status_code,
-        error_code=error_code,
-        error_category=error_category,
+        error_code=known_codes.get(error_code, error_code),
+        error_category=known_codes.get(error_category, error_category),
         details=details,
         request_id=request_id,
         metadata=metadata,
     )
+    return _with_shared_metadata(response)
 
 
 def error_from_exception(
@@ -184,15 +301,18 @@ def error_from_exception(
         ... except AppException as e:
         ...     return error_from_exception(e, request_id="req-123")
     """
-    if _logger and _settings:
+    settings = _get_settings()
+    logger = _get_logger() if settings else None
+    if logger:
         # Log in development/debug mode only
-        if _settings.is_development or _settings.debug:
-            _logger.debug(
+        if settings.is_development or settings.debug:
+            logger.debug(
                 f"Converting {exception.__class__.__name__} to ErrorResponse",
                 extra={"request_id": request_id},
             )
 
-    return ErrorResponse.from_exception(exception, request_id=request_id)
+    response = ErrorResponse.from_exception(exception, request_id=request_id)
+    return _with_shared_metadata(response)
 
 
 def validation_error(
@@ -210,7 +330,7 @@ def validation_error(
         validation_errors: List of field-level validation errors
         details: Optional additional error details
         request_id: Optional request identifier
-        metadata: Optional additional metadata
+        metadata: Optional additional metadata (default: shared metadata)
 
     Returns:
         ValidationErrorResponse with validation errors
@@ -222,7 +342,7 @@ def validation_error(
         ...     ]
         ... )
     """
-    return ValidationErrorResponse(
+    response = ValidationErrorResponse(
         success=False,
         message=message,
         status_code=422,
@@ -233,6 +353,7 @@ def validation_error(
         request_id=request_id,
         metadata=metadata,
     )
+    return _with_shared_metadata(response)
 
 
 def paginated(
@@ -248,6 +369,10 @@ def paginated(
     Create a paginated response.
 
     Automatically calculates total pages from total items and page size.
+    Items are stored as given, without checking them against any type -
+    use this for data the application produced itself (e.g. repository
+    results). For items from outside that boundary, use
+    ``paginated_validated()``.
 
     Args:
         items: List of items for current page
@@ -256,7 +381,7 @@ def paginated(
         total: Total number of items
         message: Optional success message
         request_id: Optional request identifier
-        metadata: Optional additional metadata
+        metadata: Optional additional metadata (default: shared metadata)
 
     Returns:
         PaginatedResponse with items and page info
@@ -269,38 +394,93 @@ def paginated(
         ...     total=100
         ... )
     """
-    pages = ceil(total / size) if size > 0 else 0
+    response = PaginatedResponse[T](
+        success=True,
+        items=items,
+        page_info=_page_info(page, size, total),
+        message=message,
+        request_id=request_id,
+        metadata=metadata,
+    )
+    return _with_shared_metadata(response)
+
+
+def paginated_validated(
+    items: Iterable[Any],
+    item_type: Type[T],
+    page: int,
+    size: int,
+    total: int,
+    message: Optional[str] = None,
+    request_id: Optional[str] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> PaginatedResponse[T]:
+    """
+    Create a paginated response, validating every item against item_type.
 
-    return PaginatedResponse[T](
+    Same as ``paginated()``, but the response is parametrized with
+    item_type, so each item is validated (and converted, e.g. dicts into
+    models). Use this when items come from outside the application, such
+    as a third-party API. The per-item check costs O(len(items)).
+
+    Args:
+        items: Items for current page
+        item_type: Type every item must validate as
+        page: Current page number (1-indexed)
+        size: Items per page
+        total: Total number of items
+        message: Optional success message
+        request_id: Optional request identifier
+        metadata: Optional additional metadata (default: shared metadata)
+
+    Returns:
+        PaginatedResponse[item_type] with validated items and page info
+
+    Raises:
+        ValidationError: If an item doesn't validate as item_type
+
+    Examples:
+        >>> paginated_validated(
+        ...     items=supplier_response["products"],
+        ...     item_type=Product,
+        ...     page=1,
+        ...     size=20,
+        ...     total=100
+        ... )
+    """
+    response = PaginatedResponse[item_type](
         success=True,
         items=items,
-        page_info=PageInfo(page=page, size=size, total=total, pages=pages),
+        page_info=_page_info(page, size, total),
         message=message,
         request_id=request_id,
         metadata=metadata,
     )
+    return _with_shared_metadata(response)
 
 
 def cursor_paginated(
-    items: List[T],
+    items: Iterable[T],
     cursor: str,
     has_next: bool,
     has_previous: bool = False,
     message: Optional[str] = None,
     request_id: Optional[str] = None,
     metadata: Optional[Dict[str, Any]] = None,
+    count: Optional[int] = None,
 ) -> CursorPaginatedResponse[T]:
     """
     Create a cursor-based paginated response.
 
     Args:
-        items: List of items for current cursor
+        items: Items for current cursor (any iterable, consumed once)
         cursor: Current cursor position
         has_next: Whether more items exist after cursor
         has_previous: Whether items exist before cursor
         message: Optional success message
         request_id: Optional request identifier
-        metadata: Optional additional metadata
+        metadata: Optional additional metadata (default: shared metadata)
+        count: Item count if already known, otherwise len(items)
 
     Returns:
         CursorPaginatedResponse with items and cursor info
@@ -312,19 +492,23 @@ def cursor_paginated(
         ...     has_next=True
         ... )
     """
-    return CursorPaginatedResponse[T](
+    if type(items) is not list:
+        items = list(items)
+
+    response = CursorPaginatedResponse[T](
         success=True,
         items=items,
         cursor_info=CursorInfo(
             cursor=cursor,
             has_next=has_next,
             has_previous=has_previous,
-            count=len(items),
+            count=len(items) if count is None else count,
         ),
         message=message,
         request_id=request_id,
         metadata=metadata,
     )
+    return _with_shared_metadata(response)
 
 
 # Convenience aliases
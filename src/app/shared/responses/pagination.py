@@ -6,7 +6,7 @@ Optimized for webshop and list views.
 """
 
 from typing import Generic, TypeVar, List
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict
 from .base import BaseResponse
 
 # Generic type variable for paginated items
@@ -27,6 +27,8 @@ class PageInfo(BaseModel):
         pages: Total number of pages available
     """
 
+    # Bounds are checked inside pydantic-core's int validator (no Python
+    # call) and show up as minimum/maximum in the OpenAPI schema
     page: int = Field(..., description="Current page number (1-indexed)", ge=1)
 
     size: int = Field(..., description="Number of items per page", ge=1, le=1000)
@@ -35,15 +37,12 @@ class PageInfo(BaseModel):
 
     pages: int = Field(..., description="Total number of pages available", ge=0)
 
-    @field_validator("page")
-    @classmethod
-    def validate_page(cls, v: int, info) -> int:
-        """Validate page is within bounds if pages is set."""
-        # Note: pages might not be set yet during initialization
-        return v
-
+    # Frozen so paginated() can share cached instances between responses
     model_config = ConfigDict(
-        json_schema_extra={"example": {"page": 1, "size": 20, "total": 100, "pages": 5}}
+        frozen=True,
+        json_schema_extra={
+            "example": {"page": 1, "size": 20, "total": 100, "pages": 5}
+        },
     )
 
 
@@ -70,13 +69,6 @@ class PaginatedResponse(BaseResponse, Generic[T]):
 
     page_info: PageInfo = Field(..., description="Pagination metadata")
 
-    @field_validator("items")
-    @classmethod
-    def validate_items_length(cls, v: List[T], info) -> List[T]:
-        """Validate items length matches page_info if available."""
-        # Note: page_info might not be set yet during initialization
-        return v
-
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
@@ -120,6 +112,7 @@ class CursorInfo(BaseModel):
     count: int = Field(..., description="Number of items in current result", ge=0)
 
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "example": {
                 "cursor": "eyJpZCI6MTIzfQ==",
@@ -127,7 +120,7 @@ class CursorInfo(BaseModel):
                 "has_previous": False,
                 "count": 20,
             }
-        }
+        },
     )
 
 
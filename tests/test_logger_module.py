@@ -147,6 +147,16 @@ def test_clear_loggers():
     # Can't test identity after clear since fixture also clears
 
 
+def test_concurrent_get_logger_builds_once():
+    """Test that concurrent lookups of a new name share one instance."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        loggers = list(pool.map(lambda _: get_logger("test.concurrent"), range(32)))
+
+    assert all(logger is loggers[0] for logger in loggers)
+
+
 def test_reserved_attributes_filtered():
     """Test that reserved LogRecord attributes are filtered out."""
     logger = get_logger("test.reserved")
@@ -156,6 +166,77 @@ def test_reserved_attributes_filtered():
     # If we get here without exception, the test passes
 
 
+def test_cached_get_logger_skips_logging_manager():
+    """Test that cache hits don't go through logging.getLogger."""
+    from unittest.mock import patch
+
+    logger = get_logger("test.cache_hit")
+
+    with patch("logging.getLogger") as mock_get_logger:
+        assert get_logger("test.cache_hit") is logger
+
+    mock_get_logger.assert_not_called()
+
+
+def test_level_cache_invalidation(capsys):
+    """Test that level changes take effect after invalidate_level_cache()."""
+    import logging
+
+    logger = get_logger("test.level_cache", environment=Environment.DEVELOPMENT)
+
+    logging.getLogger("test.level_cache").setLevel(logging.WARNING)
+    logger.invalidate_level_cache()
+    logger.debug("Suppressed debug")
+
+    logging.getLogger("test.level_cache").setLevel(logging.DEBUG)
+    logger.invalidate_level_cache()
+    logger.debug("Visible debug")
+
+    captured = capsys.readouterr()
+    assert "Suppressed debug" not in captured.out
+    assert "Visible debug" in captured.out
+
+
+def test_level_cache_respects_logging_disable(capsys):
+    """Test that logging.disable() silences the logger after invalidation."""
+    import logging
+
+    logger = get_logger("test.level_disable", environment=Environment.DEVELOPMENT)
+
+    logging.disable(logging.CRITICAL)
+    try:
+        logger.invalidate_level_cache()
+        logger.info("Disabled info")
+        logger.critical("Disabled critical")
+    finally:
+        logging.disable(logging.NOTSET)
+        logger.invalidate_level_cache()
+
+    assert "Disabled" not in capsys.readouterr().out
+
+
+def test_subclass_can_override_level_methods(capsys):
+    """Test that AppLogger subclasses can wrap level methods via super()."""
+    from app.shared.logger import AppLogger
+
+    class CountingLogger(AppLogger):
+        def __init__(self, config):
+            super().__init__(config)
+            self.error_count = 0
+
+        def error(self, message: str, **kwargs):
+            self.error_count += 1
+            super().error(message, **kwargs)
+
+    logger = CountingLogger(
+        LoggerConfig.from_environment("test.subclass", Environment.DEVELOPMENT)
+    )
+    logger.error("Counted error")
+
+    assert logger.error_count == 1
+    assert "Counted error" in capsys.readouterr().out
+
+
 def test_environment_config():
     """Test environment-based configuration."""
     # Test development config
@@ -8,7 +8,7 @@ Tests type safety, validation, serialization, and integration with exceptions.
 import pytest
 from datetime import datetime
 from typing import Dict, Any
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 # Import response models
 from app.shared.responses import (
@@ -33,6 +33,7 @@ from app.shared.responses import (
     error_from_exception,
     validation_error,
     paginated,
+    paginated_validated,
     cursor_paginated,
 )
 
@@ -43,6 +44,51 @@ from app.shared.exceptions import (
 )
 
 
+class PageItem(BaseModel):
+    """Item model for testing validated pagination."""
+
+    value: int
+
+
+def _assert_ok(response, cls, **expected):
+    """Assert a successful response of type cls with the expected attributes."""
+    # isinstance, not type(...) is cls: factories return parametrized
+    # subclasses such as SuccessResponse[T]
+    assert isinstance(response, cls)
+    assert response.success is True
+    for name, value in expected.items():
+        assert getattr(response, name) == value, name
+
+
+# ============================================================================
+# Module-scoped fixtures: parametrized response types shared by the tests
+# ============================================================================
+
+
+@pytest.fixture(scope="module")
+def success_response_type():
+    """SuccessResponse parametrized with a generic dict payload."""
+    return SuccessResponse[Dict[str, Any]]
+
+
+@pytest.fixture(scope="module")
+def data_response_type():
+    """DataResponse parametrized with a generic dict payload."""
+    return DataResponse[Dict[str, Any]]
+
+
+@pytest.fixture(scope="module")
+def paginated_response_type():
+    """PaginatedResponse parametrized with int-valued dict items."""
+    return PaginatedResponse[Dict[str, int]]
+
+
+@pytest.fixture(scope="module")
+def cursor_paginated_response_type():
+    """CursorPaginatedResponse parametrized with int-valued dict items."""
+    return CursorPaginatedResponse[Dict[str, int]]
+
+
 # ============================================================================
 # Test BaseResponse
 # ============================================================================
@@ -88,28 +134,118 @@ def test_base_response_serialization():
     assert data["message"] == "Test"
 
 
+def test_coarse_timestamp_reused_within_millisecond(monkeypatch):
+    """Test the opt-in coarse timestamp is shared within 1ms and then refreshed."""
+    from app.shared.responses import base
+
+    clock = {"wall": 1_700_000_000_000_000_000, "mono": 5_000_000_000}
+    monkeypatch.setattr(base, "_last_timestamp", (0, None))
+    monkeypatch.setattr(base.time, "time_ns", lambda: clock["wall"])
+    monkeypatch.setattr(base.time, "monotonic_ns", lambda: clock["mono"])
+    first = base._coarse_utcnow()
+
+    clock["wall"] += 999_999
+    clock["mono"] += 999_999
+    assert base._coarse_utcnow() is first
+
+    clock["wall"] += 1
+    clock["mono"] += 1
+    refreshed = base._coarse_utcnow()
+    assert refreshed is not first
+    assert refreshed.tzinfo is not None
+    assert refreshed > first
+
+
+def test_coarse_timestamp_survives_wall_clock_step_back(monkeypatch):
+    """Test a backward wall-clock step doesn't pin the cached timestamp."""
+    from app.shared.responses import base
+
+    clock = {"wall": 1_700_000_000_000_000_000, "mono": 5_000_000_000}
+    monkeypatch.setattr(base, "_last_timestamp", (0, None))
+    monkeypatch.setattr(base.time, "time_ns", lambda: clock["wall"])
+    monkeypatch.setattr(base.time, "monotonic_ns", lambda: clock["mono"])
+    first = base._coarse_utcnow()
+
+    # Wall clock steps back an hour while real time moves on by 1ms
+    clock["wall"] -= 3600 * 10**9 - 1_000_000
+    clock["mono"] += 1_000_000
+    stepped = base._coarse_utcnow()
+
+    assert stepped is not first
+    assert (first - stepped).total_seconds() == pytest.approx(3600 - 0.001)
+
+
+def test_to_dict_matches_model_dump():
+    """Test that to_dict() produces the same output as model_dump()."""
+    responses = [
+        BaseResponse(success=True, message="Test", metadata={"k": "v"}),
+        success(data={"id": 1}, message="OK"),
+        ErrorResponse.from_exception(NotFoundError(message="Missing")),
+        paginated(items=[{"id": 1}, {"id": 2}], page=1, size=2, total=5),
+    ]
+
+    for response in responses:
+        assert response.to_dict() == response.model_dump()
+        assert response.to_dict(mode="json") == response.model_dump(mode="json")
+
+
+def test_to_json_matches_model_dump_json():
+    """Test that to_json() returns model_dump_json() as UTF-8 bytes."""
+    response = success(data={"name": "Käse"}, message="OK")
+
+    assert response.to_json() == response.model_dump_json().encode()
+
+
+def test_parametrized_responses_cached():
+    """Test that subscribing a generic response reuses the cached class."""
+    from app.shared.responses import base
+
+    response_type = SuccessResponse[Dict[str, Any]]
+
+    assert SuccessResponse[Dict[str, Any]] is response_type
+    assert base._parametrized[(SuccessResponse, Dict[str, Any])] is response_type
+    assert PaginatedResponse[int] is not SuccessResponse[int]
+
+
+def test_recursive_generic_response_not_cached_as_placeholder():
+    """Test that recursive generic responses resolve after subscription."""
+    from typing import Generic, List, Optional, TypeVar
+
+    T = TypeVar("T")
+
+    class Node(SuccessResponse[T], Generic[T]):
+        children: Optional[List["Node[T]"]] = None
+
+    node_type = Node[int]
+
+    class Wrapper(BaseModel, Generic[T]):
+        node: Node[T]
+
+    wrapper = Wrapper[int](node={"data": 1, "children": [{"data": 2}]})
+
+    assert isinstance(node_type, type)
+    assert Node[int] is node_type
+    assert wrapper.node.children[0].data == 2
+
+
 # ============================================================================
 # Test SuccessResponse
 # ============================================================================
 
 
-def test_success_response_without_data():
+def test_success_response_without_data(success_response_type):
     """Test SuccessResponse without data."""
-    response = SuccessResponse[Dict[str, Any]](
-        success=True, message="Operation completed"
-    )
+    response = success_response_type(success=True, message="Operation completed")
 
     assert response.success is True
     assert response.message == "Operation completed"
     assert response.data is None
 
 
-def test_success_response_with_data():
+def test_success_response_with_data(success_response_type):
     """Test SuccessResponse with data."""
     data = {"id": 1, "name": "John"}
-    response = SuccessResponse[Dict[str, Any]](
-        success=True, data=data, message="User found"
-    )
+    response = success_response_type(success=True, data=data, message="User found")
 
     assert response.success is True
     assert response.data == data
@@ -132,18 +268,16 @@ def test_success_response_type_safety():
 # ============================================================================
 
 
-def test_data_response_requires_data():
+def test_data_response_requires_data(data_response_type):
     """Test DataResponse requires data field."""
     with pytest.raises(ValidationError):
-        DataResponse[Dict[str, Any]](success=True, message="Test")
+        data_response_type(success=True, message="Test")
 
 
-def test_data_response_with_data():
+def test_data_response_with_data(data_response_type):
     """Test DataResponse with required data."""
     data = {"id": 1, "value": "test"}
-    response = DataResponse[Dict[str, Any]](
-        success=True, data=data, message="Data retrieved"
-    )
+    response = data_response_type(success=True, data=data, message="Data retrieved")
 
     assert response.success is True
     assert response.data == data
@@ -236,6 +370,36 @@ def test_error_response_from_exception():
     assert "entity_type" in response.details
 
 
+@pytest.mark.parametrize(
+    "category, status_code",
+    [
+        ("not_found", 404),
+        ("validation", 422),
+        ("authentication", 401),
+        ("authorization", 403),
+        ("business_rule", 400),
+        ("database", 500),
+        ("external_service", 502),
+        ("internal", 500),
+    ],
+)
+def test_error_response_from_exception_status_codes(category, status_code):
+    """Test from_exception() maps every ErrorCategory to its HTTP status."""
+    from app.shared.exceptions import AppException, ErrorCategory, ErrorCode
+
+    exception = AppException(
+        message="Error",
+        error_code=ErrorCode.INTERNAL_ERROR,
+        category=ErrorCategory(category),
+        should_auto_log=False,
+    )
+
+    response = ErrorResponse.from_exception(exception)
+
+    assert response.status_code == status_code
+    assert response.error_category == category
+
+
 # ============================================================================
 # Test ValidationErrorResponse
 # ============================================================================
@@ -266,6 +430,35 @@ def test_validation_error_response_with_errors():
     assert len(response.validation_errors) == 2
 
 
+def test_validation_error_response_to_dict_soa():
+    """Test to_dict_soa() groups validation errors by key."""
+    response = ValidationErrorResponse(
+        message="Validation failed",
+        validation_errors=[
+            {"field": "email", "message": "Invalid email format"},
+            {"field": "age", "message": "Must be at least 18", "type": "range"},
+        ],
+    )
+
+    data = response.to_dict_soa()
+
+    assert data["validation_errors"] == {
+        "field": ["email", "age"],
+        "message": ["Invalid email format", "Must be at least 18"],
+        "type": [None, "range"],
+    }
+    assert data["message"] == "Validation failed"
+    assert data["status_code"] == 422
+
+    no_errors = ValidationErrorResponse(message="Validation failed").to_dict_soa()
+    assert no_errors["validation_errors"] is None
+
+    json_data = response.to_dict_soa(mode="json")
+    assert json_data["validation_errors"] == data["validation_errors"]
+    assert json_data["timestamp"] == response.to_dict(mode="json")["timestamp"]
+    assert isinstance(json_data["timestamp"], str)
+
+
 # ============================================================================
 # Test PageInfo
 # ============================================================================
@@ -301,12 +494,12 @@ def test_page_info_validation():
 # ============================================================================
 
 
-def test_paginated_response():
+def test_paginated_response(paginated_response_type):
     """Test PaginatedResponse with items and page info."""
     items = [{"id": 1}, {"id": 2}, {"id": 3}]
     page_info = PageInfo(page=1, size=3, total=10, pages=4)
 
-    response = PaginatedResponse[Dict[str, int]](
+    response = paginated_response_type(
         success=True, items=items, page_info=page_info, message="Items retrieved"
     )
 
@@ -317,13 +510,11 @@ def test_paginated_response():
     assert response.message == "Items retrieved"
 
 
-def test_paginated_response_empty():
+def test_paginated_response_empty(paginated_response_type):
     """Test PaginatedResponse with empty items."""
     page_info = PageInfo(page=1, size=20, total=0, pages=0)
 
-    response = PaginatedResponse[Dict[str, Any]](
-        success=True, items=[], page_info=page_info
-    )
+    response = paginated_response_type(success=True, items=[], page_info=page_info)
 
     assert response.items == []
     assert response.page_info.total == 0
@@ -351,14 +542,14 @@ def test_cursor_info_creation():
 # ============================================================================
 
 
-def test_cursor_paginated_response():
+def test_cursor_paginated_response(cursor_paginated_response_type):
     """Test CursorPaginatedResponse with items and cursor info."""
     items = [{"id": 1}, {"id": 2}]
     cursor_info = CursorInfo(
         cursor="abc123", has_next=True, has_previous=False, count=2
     )
 
-    response = CursorPaginatedResponse[Dict[str, int]](
+    response = cursor_paginated_response_type(
         success=True, items=items, cursor_info=cursor_info
     )
 
@@ -377,20 +568,15 @@ def test_factory_success_with_data():
     data = {"id": 1, "name": "Test"}
     response = success(data=data, message="Success")
 
-    assert isinstance(response, SuccessResponse)
-    assert response.success is True
-    assert response.data == data
-    assert response.message == "Success"
+    _assert_ok(response, SuccessResponse, data=data, message="Success")
 
 
 def test_factory_success_without_data():
     """Test success() factory function without data."""
     response = success(message="Completed")
 
-    assert isinstance(response, SuccessResponse)
-    assert response.success is True
+    _assert_ok(response, SuccessResponse, message="Completed")
     assert response.data is None
-    assert response.message == "Completed"
 
 
 # ============================================================================
@@ -403,9 +589,7 @@ def test_factory_data_response():
     data = {"key": "value"}
     response = data_response(data=data, message="Found")
 
-    assert isinstance(response, DataResponse)
-    assert response.success is True
-    assert response.data == data
+    _assert_ok(response, DataResponse, data=data)
 
 
 # ============================================================================
@@ -417,9 +601,7 @@ def test_factory_message_response():
     """Test message_response() factory function."""
     response = message_response("Operation completed")
 
-    assert isinstance(response, MessageResponse)
-    assert response.success is True
-    assert response.message == "Operation completed"
+    _assert_ok(response, MessageResponse, message="Operation completed")
 
 
 # ============================================================================
@@ -456,6 +638,25 @@ def test_factory_error_with_details():
     assert response.details == details
 
 
+def test_factory_error_shares_known_codes():
+    """Test error() stores known codes as one shared plain string."""
+    from app.shared.exceptions import ErrorCategory, ErrorCode
+
+    response = error(
+        message="User not found",
+        status_code=404,
+        error_code=ErrorCode.RESOURCE_NOT_FOUND,
+        error_category="".join(["not_", "found"]),
+    )
+
+    assert type(response.error_code) is str
+    assert response.error_code is ErrorCode.RESOURCE_NOT_FOUND.value
+    assert response.error_category is ErrorCategory.NOT_FOUND.value
+
+    # Unknown codes pass through unchanged
+    assert error("Oops", 400, "CUSTOM", "custom").error_code == "CUSTOM"
+
+
 # ============================================================================
 # Test Factory: error_from_exception()
 # ============================================================================
@@ -507,9 +708,7 @@ def test_factory_paginated():
         items=items, page=1, size=20, total=100, message="Products retrieved"
     )
 
-    assert isinstance(response, PaginatedResponse)
-    assert response.success is True
-    assert len(response.items) == 20
+    _assert_ok(response, PaginatedResponse, items=items)
     assert response.page_info.page == 1
     assert response.page_info.size == 20
     assert response.page_info.total == 100
@@ -530,6 +729,101 @@ def test_factory_paginated_calculates_pages():
     response = paginated(items=[], page=1, size=10, total=0)
     assert response.page_info.pages == 0
 
+    # Exact for totals beyond float precision
+    response = paginated(items=[], page=1, size=3, total=3 * 2**60 + 1)
+    assert response.page_info.pages == 2**60 + 1
+
+
+def test_factory_paginated_validated():
+    """Test paginated_validated() validates and converts every item."""
+    response = paginated_validated(
+        items=[{"value": 5}, {"value": 7}],
+        item_type=PageItem,
+        page=1,
+        size=2,
+        total=2,
+    )
+
+    assert response.items == [PageItem(value=5), PageItem(value=7)]
+    assert response.page_info.pages == 1
+
+    with pytest.raises(ValidationError):
+        paginated_validated(
+            items=[{"value": "not a number"}],
+            item_type=PageItem,
+            page=1,
+            size=1,
+            total=1,
+        )
+
+    # paginated() stores trusted items untouched
+    item = {"value": "not a number"}
+    assert paginated(items=[item], page=1, size=1, total=1).items[0] is item
+
+
+def test_factory_paginated_reuses_page_info():
+    """Test paginated() shares frozen PageInfo instances for equal values."""
+    first = paginated(items=[], page=1, size=20, total=0)
+    second = paginated(items=[], page=1, size=20, total=0)
+
+    assert first.page_info is second.page_info
+    with pytest.raises(ValidationError):
+        first.page_info.total = 5
+
+    # Invalid values are rejected on every call, not cached
+    for _ in range(2):
+        with pytest.raises(ValidationError):
+            paginated(items=[], page=0, size=20, total=0)
+
+
+def test_error_factory_normalizes_enum_codes():
+    """Test that error() stores str-enum codes and categories as plain str."""
+    from app.shared.exceptions import ErrorCategory, ErrorCode
+
+    response = error(
+        "Missing", 404, ErrorCode.RESOURCE_NOT_FOUND, ErrorCategory.NOT_FOUND
+    )
+
+    assert type(response.error_code) is str
+    assert type(response.error_category) is str
+    assert response.error_code == ErrorCode.RESOURCE_NOT_FOUND.value
+    assert response.error_category == ErrorCategory.NOT_FOUND.value
+
+
+def test_paginated_factory_materializes_generator():
+    """Test that paginated() turns generator items into a list."""
+    response = paginated(items=({"id": i} for i in range(3)), page=1, size=3, total=3)
+
+    assert response.items == [{"id": 0}, {"id": 1}, {"id": 2}]
+    assert response.to_dict()["items"] == [{"id": 0}, {"id": 1}, {"id": 2}]
+
+
+def test_factories_share_metadata():
+    """Test factories attach the one shared, read-only metadata object."""
+    from app.shared.responses import factory, set_shared_metadata
+
+    set_shared_metadata({"api_version": "1.0"})
+    try:
+        shared = factory._shared_metadata
+        first = success(data={"id": 1})
+        second = paginated(items=[], page=1, size=10, total=0)
+        third = error_from_exception(NotFoundError(message="Missing"))
+
+        assert first.metadata is shared
+        assert second.metadata is shared
+        assert third.metadata is shared
+        assert first.to_dict(mode="json")["metadata"] == {"api_version": "1.0"}
+        with pytest.raises(TypeError):
+            first.metadata["api_version"] = "2.0"
+        assert first.model_copy(deep=True).metadata == {"api_version": "1.0"}
+
+        # An explicit argument still wins
+        assert success(metadata={"k": "v"}).metadata == {"k": "v"}
+    finally:
+        set_shared_metadata(None)
+
+    assert success().metadata is None
+
 
 # ============================================================================
 # Test Factory: cursor_paginated()
@@ -543,14 +837,27 @@ def test_factory_cursor_paginated():
         items=items, cursor="abc123", has_next=True, has_previous=False
     )
 
-    assert isinstance(response, CursorPaginatedResponse)
-    assert response.success is True
-    assert response.items == items
+    _assert_ok(response, CursorPaginatedResponse, items=items)
     assert response.cursor_info.cursor == "abc123"
     assert response.cursor_info.has_next is True
     assert response.cursor_info.count == 2  # Auto-calculated
 
 
+def test_factory_cursor_paginated_generator_and_count():
+    """Test cursor_paginated() materializes iterables and honours count."""
+    response = cursor_paginated(
+        items=({"id": i} for i in range(3)), cursor="abc123", has_next=False
+    )
+    assert response.items == [{"id": 0}, {"id": 1}, {"id": 2}]
+    assert response.cursor_info.count == 3
+
+    # An explicit count wins over len(items)
+    response = cursor_paginated(
+        items=[{"id": 1}], cursor="abc123", has_next=True, count=5
+    )
+    assert response.cursor_info.count == 5
+
+
 # ============================================================================
 # Test Factory Aliases
 # ============================================================================
@@ -561,13 +868,10 @@ def test_factory_aliases():
     from app.shared.responses import ok, created, accepted
 
     # ok is alias for success
-    response = ok(data={"test": "data"})
-    assert isinstance(response, SuccessResponse)
+    _assert_ok(ok(data={"test": "data"}), SuccessResponse)
 
     # created is alias for success
-    response = created(data={"id": 1})
-    assert isinstance(response, SuccessResponse)
+    _assert_ok(created(data={"id": 1}), SuccessResponse)
 
     # accepted is alias for success
-    response = accepted(message="Processing")
-    assert isinstance(response, SuccessResponse)
+    _assert_ok(accepted(message="Processing"), SuccessResponse)